@@ -0,0 +1,478 @@
+"""
+Offline benchmark suite for the Ani-Automation tools.
+
+Every network dependency is replaced with a local stand-in so results are
+reproducible and comparable across commits:
+  * Pollinations / Picsum images -> local HTTP server (generated JPEG)
+  * YouTube media                -> local HTTP server (direct MP4 link)
+  * Gemini API                   -> local HTTP server (canned REST reply)
+  * Cleaner targets              -> synthetic temp-directory trees
+
+Usage:
+    python benchmarks/run_benchmarks.py                       # all benchmarks
+    python benchmarks/run_benchmarks.py --only cleaner interest
+    python benchmarks/run_benchmarks.py --output bench.json --repeat 5
+"""
+import argparse
+import datetime
+import io
+import json
+import math
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import wave
+from contextlib import contextmanager, redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Make `tools` importable when run as a plain script
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+SEED = 1234
+IMAGE_SIZE = (1280, 720)
+MEDIA_SIZE_MB = 32
+GEMINI_REPLY = "This is a canned reply from the offline Gemini stand-in."
+
+# ==========================================
+# 1. LOCAL STAND-IN SERVER
+# ==========================================
+def make_jpeg_bytes(size=IMAGE_SIZE):
+    """Builds a deterministic gradient JPEG, like the images the real APIs return."""
+    from PIL import Image
+
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+def make_media_bytes(size_mb=MEDIA_SIZE_MB):
+    """Deterministic payload served as a direct MP4 link for the download path."""
+    rng = random.Random(SEED)
+    return rng.randbytes(size_mb * 2**20)
+
+def make_mp3_bytes(seconds=3, rate=22050):
+    """Short sine tone encoded as MP3, used as the 'uploaded' music file for the video maker."""
+    from moviepy.config import FFMPEG_BINARY
+
+    workdir = tempfile.mkdtemp(prefix="ani_bench_mp3_")
+    wav_path = os.path.join(workdir, "tone.wav")
+    mp3_path = os.path.join(workdir, "tone.mp3")
+    try:
+        with wave.open(wav_path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(rate)
+            frames = bytearray()
+            for i in range(seconds * rate):
+                sample = int(12000 * math.sin(2 * math.pi * 440 * i / rate))
+                frames += sample.to_bytes(2, "little", signed=True)
+            w.writeframes(bytes(frames))
+        # Encode with the same ffmpeg moviepy uses, so the upload matches the real MP3 path
+        subprocess.run(
+            [FFMPEG_BINARY, "-y", "-loglevel", "error", "-i", wav_path, "-codec:a", "libmp3lame", mp3_path],
+            check=True
+        )
+        with open(mp3_path, "rb") as f:
+            return f.read()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves images, media files and Gemini replies from memory."""
+
+    protocol_version = "HTTP/1.1"
+    routes = {}  # filled in by LocalServer
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    def _send(self, status, body, content_type, extra_headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # yt-dlp sniffs the first bytes of a direct link, then hangs up
+
+    def _send_media(self, body):
+        # yt-dlp asks for byte ranges, so honour a single "bytes=a-b", "bytes=a-" or "bytes=-n" range
+        range_header = self.headers.get("Range")
+        if not range_header:
+            self._send(200, body, "video/mp4", {"Accept-Ranges": "bytes"})
+            return
+        size = len(body)
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip())
+        start = end = None
+        if match and match.group(1):
+            start = int(match.group(1))
+            end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+        elif match and match.group(2) and int(match.group(2)) > 0:
+            start, end = max(size - int(match.group(2)), 0), size - 1  # last n bytes
+        if start is None or start >= size or start > end:
+            self._send(416, b"", "video/mp4", {"Content-Range": f"bytes */{size}"})
+            return
+        self._send(206, body[start:end + 1], "video/mp4", {
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{size}",
+        })
+
+    def do_GET(self):
+        path = urllib.parse.urlparse(self.path).path
+        if path.startswith("/prompt/") or path.startswith("/seed/"):
+            self._send(200, self.routes["image"], "image/jpeg")
+        elif path.startswith("/media/"):
+            self._send_media(self.routes["media"])
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        # Drain the request body so keep-alive connections stay in sync
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if ":generateContent" in self.path:
+            self._send(200, self.routes["gemini"], "application/json")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+class LocalServer:
+    """Threaded HTTP server on 127.0.0.1 with an ephemeral port."""
+
+    def __init__(self, media_size_mb=MEDIA_SIZE_MB):
+        try:
+            image = make_jpeg_bytes()
+        except ImportError:
+            image = b""  # Pillow missing: the video benchmark will be skipped anyway
+        handler = type("Handler", (StandInHandler,), {"routes": {
+            "image": image,
+            "media": make_media_bytes(media_size_mb),
+            "gemini": json.dumps({
+                "candidates": [{
+                    "content": {"parts": [{"text": GEMINI_REPLY}], "role": "model"},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }]
+            }).encode(),
+        }})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@contextmanager
+def redirect_requests(base_url):
+    """Points every requests.get() at the local server, keeping the original path."""
+    import requests
+
+    original_get = requests.get
+    local = urllib.parse.urlparse(base_url)
+
+    def local_get(url, *args, **kwargs):
+        parts = urllib.parse.urlparse(url)._replace(scheme=local.scheme, netloc=local.netloc)
+        return original_get(urllib.parse.urlunparse(parts), *args, **kwargs)
+
+    with mock.patch.object(requests, "get", local_get):
+        yield
+
+# ==========================================
+# 2. HELPERS
+# ==========================================
+class NullWidget:
+    """Stands in for st.progress() / st.empty() so the UI does not skew timings."""
+
+    def progress(self, value):
+        pass
+
+    def text(self, value):
+        pass
+
+    def markdown(self, value):
+        pass
+
+def summarize(samples):
+    """Median/min/max of a list of numbers, rounded for readable JSON."""
+    return {
+        "median": round(statistics.median(samples), 6),
+        "min": round(min(samples), 6),
+        "max": round(max(samples), 6),
+    }
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except Exception:
+        return None
+
+def build_tree(root, n_files, n_dirs, files_per_dir, file_size):
+    """Creates a synthetic temp-folder layout: loose files plus nested folders."""
+    payload = b"x" * file_size
+    for i in range(n_files):
+        with open(os.path.join(root, f"tmp_{i:05d}.tmp"), "wb") as f:
+            f.write(payload)
+    for d in range(n_dirs):
+        sub = os.path.join(root, f"dir_{d:04d}", "nested")
+        os.makedirs(sub)
+        for i in range(files_per_dir):
+            with open(os.path.join(sub, f"cache_{i:04d}.bin"), "wb") as f:
+                f.write(payload)
+    return n_files + n_dirs * files_per_dir
+
+# ==========================================
+# 3. BENCHMARKS
+# ==========================================
+def bench_interest(args, server):
+    """Batch throughput of the simple interest calculation."""
+    from tools.simple_interest import calculate_interest
+
+    rng = random.Random(SEED)
+    batch = [
+        (rng.uniform(1000, 1000000), rng.uniform(0, 50), rng.uniform(0.5, 30))
+        for _ in range(args.interest_batch)
+    ]
+    rates = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for principal, rate, time_years in batch:
+            calculate_interest(principal, rate, time_years)
+        rates.append(len(batch) / (time.perf_counter() - start))
+    return {"batch_size": len(batch), "calcs_per_sec": summarize(rates)}
+
+def bench_cleaner(args, server):
+    """Files/sec for clean_directory on a synthetic temp tree."""
+    from tools.cleaner import clean_directory
+
+    rates, walls = [], []
+    widget = NullWidget()
+    for _ in range(args.repeat):
+        root = tempfile.mkdtemp(prefix="ani_bench_clean_")
+        try:
+            total_files = build_tree(
+                root, args.cleaner_files, args.cleaner_dirs,
+                args.cleaner_files_per_dir, args.cleaner_file_size
+            )
+            start = time.perf_counter()
+            deleted, errors = clean_directory(root, widget, widget, 0, 1)
+            wall = time.perf_counter() - start
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+        if errors:
+            raise RuntimeError(f"clean_directory reported {errors} errors")
+        walls.append(wall)
+        rates.append(total_files / wall)
+    return {
+        "files_per_run": total_files,
+        "top_level_items_deleted": deleted,
+        "wall_time_s": summarize(walls),
+        "files_per_sec": summarize(rates),
+    }
+
+def bench_youtube(args, server):
+    """
+    Throughput of youtube.download_video() from a local media URL, both end to end
+    (yt-dlp setup, probe and format selection included) and for the transfer alone.
+    """
+    from tools.youtube import download_video
+
+    url = f"{server.base_url}/media/sample.mp4"
+    rates, transfer_rates, walls = [], [], []
+    finished = []
+    extra_opts = {
+        # The local URL is a direct link, so only the generic extractor can handle it
+        'force_generic_extractor': True,
+        # Keep the progress bar out of stdout and out of the timed download
+        'noprogress': True,
+        'progress_hooks': [lambda d: d['status'] == 'finished' and finished.append(d)],
+    }
+    for _ in range(args.repeat):
+        workdir = tempfile.mkdtemp(prefix="ani_bench_yt_")
+        temp_file = os.path.join(workdir, "downloaded_video.mp4")
+        finished.clear()
+        try:
+            start = time.perf_counter()
+            download_video(url, temp_file, extra_opts)
+            wall = time.perf_counter() - start
+            size = os.path.getsize(temp_file)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        if not finished or not finished[-1].get('elapsed'):
+            raise RuntimeError("yt-dlp did not report a finished download")
+        walls.append(wall)
+        rates.append(size / 2**20 / wall)
+        transfer_rates.append(finished[-1]['downloaded_bytes'] / 2**20 / finished[-1]['elapsed'])
+    return {
+        "bytes_per_run": size,
+        "wall_time_s": summarize(walls),
+        "end_to_end_mb_per_sec": summarize(rates),
+        "transfer_mb_per_sec": summarize(transfer_rates),
+    }
+
+def bench_video(args, server):
+    """Render fps (write_videofile only) and end-to-end wall time of generate_video_logic."""
+    from moviepy import VideoClip
+    from tools import video_maker
+
+    random.seed(SEED)
+    music_bytes = make_mp3_bytes()
+    frames = args.video_duration * 24
+    fps_samples, render_walls, walls = [], [], []
+    render_times, errors = [], []
+    original_write = VideoClip.write_videofile
+
+    def timed_write(self, *a, **kw):
+        start = time.perf_counter()
+        try:
+            return original_write(self, *a, **kw)
+        finally:
+            render_times.append(time.perf_counter() - start)
+
+    with redirect_requests(server.base_url), \
+            mock.patch.object(VideoClip, "write_videofile", timed_write), \
+            mock.patch.object(video_maker.st, "error", errors.append):
+        for _ in range(args.repeat):
+            render_times.clear()
+            errors.clear()
+            start = time.perf_counter()
+            path = video_maker.generate_video_logic(
+                "A futuristic city at dusk", io.BytesIO(music_bytes), 0.5, args.video_duration
+            )
+            wall = time.perf_counter() - start
+            if errors:
+                raise RuntimeError("; ".join(str(e) for e in errors))
+            if not path or not os.path.exists(path) or not render_times:
+                raise RuntimeError("generate_video_logic did not produce a video")
+            os.remove(path)
+            walls.append(wall)
+            render_walls.append(render_times[-1])
+            fps_samples.append(frames / render_times[-1])
+    return {
+        "duration_s": args.video_duration,
+        "frames": frames,
+        "wall_time_s": summarize(walls),
+        "render_time_s": summarize(render_walls),
+        "render_fps": summarize(fps_samples),
+    }
+
+def bench_gemini(args, server):
+    """
+    Round-trip latency of a generate_content call against a fake Gemini endpoint.
+    app.py has no callable entry point, so this measures the google-generativeai
+    client (REST transport) against the stub, not app code.
+    """
+    import google.generativeai as genai
+
+    genai.configure(
+        api_key="offline-benchmark",
+        transport="rest",
+        client_options={"api_endpoint": server.base_url},
+    )
+    model = genai.GenerativeModel('gemini-pro')
+    latencies = []
+    for _ in range(args.repeat * 10):
+        start = time.perf_counter()
+        response = model.generate_content("Hello Ani-Bot")
+        latencies.append(time.perf_counter() - start)
+        if response.text != GEMINI_REPLY:
+            raise RuntimeError("unexpected reply from Gemini stand-in")
+    return {"calls": len(latencies), "latency_s": summarize(latencies)}
+
+BENCHMARKS = {
+    "interest": bench_interest,
+    "cleaner": bench_cleaner,
+    "youtube": bench_youtube,
+    "video": bench_video,
+    "gemini": bench_gemini,
+}
+
+# ==========================================
+# 4. RUNNER
+# ==========================================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the offline Ani-Automation benchmarks.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Subset of benchmarks to run.")
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout).")
+    parser.add_argument("--repeat", type=int, default=3, help="Measured runs per benchmark.")
+    parser.add_argument("--interest-batch", type=int, default=100000)
+    parser.add_argument("--cleaner-files", type=int, default=2000)
+    parser.add_argument("--cleaner-dirs", type=int, default=50)
+    parser.add_argument("--cleaner-files-per-dir", type=int, default=40)
+    parser.add_argument("--cleaner-file-size", type=int, default=4096)
+    parser.add_argument("--media-size-mb", type=int, default=MEDIA_SIZE_MB)
+    parser.add_argument("--video-duration", type=int, default=5)
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    selected = args.only or list(BENCHMARKS)
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "benchmarks": {},
+    }
+
+    with LocalServer(args.media_size_mb) as server:
+        for name in selected:
+            print(f"Running {name}...", file=sys.stderr)
+            try:
+                # Stdout is reserved for the JSON report; tool chatter goes to stderr
+                with redirect_stdout(sys.stderr):
+                    results["benchmarks"][name] = {"status": "ok", **BENCHMARKS[name](args, server)}
+            except ImportError as e:
+                # Missing optional dependency: record it instead of failing the whole run
+                results["benchmarks"][name] = {"status": "skipped", "reason": str(e)}
+            except Exception as e:
+                results["benchmarks"][name] = {"status": "error", "reason": f"{type(e).__name__}: {e}"}
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+    # Skipped benchmarks are fine; a broken one must fail the run
+    failed = [name for name, res in results["benchmarks"].items() if res["status"] == "error"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 import streamlit as st
 import datetime
 
+def calculate_interest(principal, rate, time_years):
+    """Returns (interest, total_amount) for simple interest."""
+    interest = (principal * rate * time_years) / 100
+    return interest, principal + interest
+
 def run_tool():
     """
     Advanced Simple Interest Calculator with 'Quick Select' and 'Manual' modes,
@@ -103,8 +108,7 @@ def run_tool():
             st.error("⚠️ Please enter both Principal Amount and Rate to proceed.")
         else:
             # Core Calculation
-            interest = (principal * rate * time_years) / 100
-            total_amount = principal + interest
+            interest, total_amount = calculate_interest(principal, rate, time_years)
             
             # --- RESULTS SECTION ---
             st.success("✅ Calculation Complete")
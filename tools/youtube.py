@@ -3,6 +3,19 @@ import yt_dlp
 import os
 import time
 
+def download_video(url, outtmpl, extra_opts=None):
+    """Downloads the best MP4 for `url` to `outtmpl` and returns the yt-dlp info dict."""
+    ydl_opts = {
+        'format': 'best[ext=mp4]',  # Get best quality MP4
+        'outtmpl': outtmpl,         # Save as this filename
+        'quiet': True,
+    }
+    if extra_opts:
+        ydl_opts.update(extra_opts)
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        return ydl.extract_info(url, download=True)
+
 def run_tool():
     st.subheader("📺 YouTube Video Downloader")
     st.info("ℹ️ Works on Mobile! The server downloads it first, then sends it to you.")
@@ -11,15 +24,8 @@ def run_tool():
     url = st.text_input("Paste YouTube URL here:")
     
     if url:
-        # 2. Setup options for yt-dlp
-        # We use a temporary filename to avoid conflicts
+        # 2. We use a temporary filename to avoid conflicts
         temp_file = "downloaded_video.mp4"
-        
-        ydl_opts = {
-            'format': 'best[ext=mp4]',  # Get best quality MP4
-            'outtmpl': temp_file,       # Save as this filename
-            'quiet': True,
-        }
 
         # 3. Download Button Logic
         if st.button("Fetch & Process Video"):
@@ -28,9 +34,8 @@ def run_tool():
             
             try:
                 # Run the download
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=True)
-                    video_title = info.get('title', 'video')
+                info = download_video(url, temp_file)
+                video_title = info.get('title', 'video')
                     
                 # 4. Check if file exists
                 if os.path.exists(temp_file):